@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 from colormath2.color_conversions import convert_color
 from colormath2.color_diff import delta_e_cie2000
@@ -98,28 +100,36 @@ def brightness(device_report, is_tv):
     # Map location names to their required keys
     brightness_calculation_point = "WhiteColor" if is_tv else "Center"
 
-    # Collect all Lv values into a dictionary for quick access
-    lv_values = {}
-    for m in measurements:
+    # Locations excluded from the min/max calculation
+    excluded_locations = {"RedColor", "GreenColor", "BlueColor", "BlackColor", "WhiteColor"}
+
+    # Track min/max over the remaining points in a single pass. Walking backwards
+    # and skipping locations already seen keeps one value per location: its last valid Lv
+    min_lv = math.inf
+    max_lv = -math.inf
+    typical_lv_for_report = None
+    seen_locations = set()
+    for m in reversed(measurements):
         location = m.get("Location")
+        if location in seen_locations:
+            continue
         try:
-            lv_values[location] = float(m.get("Lv"))
-        except (ValueError, TypeError, KeyError):
+            lv = float(m.get("Lv"))
+        except (ValueError, TypeError):
             continue
+        seen_locations.add(location)
 
-    # Collect values for min/max calculation
-    excluded_locations = {"RedColor", "GreenColor", "BlueColor", "BlackColor", "WhiteColor"}
-
-    # Use a filter to get all Lv except the excluded ones
-    all_lv_values = [
-        lv for loc, lv in lv_values.items()
-        if loc not in excluded_locations
-    ]
+        if location == brightness_calculation_point:
+            typical_lv_for_report = lv
+        if location in excluded_locations:
+            continue
+        if lv < min_lv:
+            min_lv = lv
+        if lv > max_lv:
+            max_lv = lv
 
-    # Calculate min, max
-    min_lv = min(all_lv_values) if all_lv_values else None
-    max_lv = max(all_lv_values) if all_lv_values else None
-    typical_lv_for_report = lv_values.get(brightness_calculation_point)
+    if min_lv == math.inf:
+        min_lv = max_lv = None
 
     return {"min": min_lv, "typ": typical_lv_for_report, "max": max_lv}
 
@@ -55,23 +55,11 @@ class SvgCoordinator:
             return ""
 
         try:
-            # Unpack the list of lists
-            (r_x, r_y) = cie_coords[0]
-            (g_x, g_y) = cie_coords[1]
-            (b_x, b_y) = cie_coords[2]
+            # Cast and convert each pair in a single pass: [(x1, y1), (x2, y2), (x3, y3)]
+            r_px, g_px, b_px = [self.cie_to_pixel(float(x), float(y)) for x, y in cie_coords]
 
-            # Ensure they are floats
-            r_x, r_y = float(r_x), float(r_y)
-            g_x, g_y = float(g_x), float(g_y)
-            b_x, b_y = float(b_x), float(b_y)
-
-            # Convert each pair (this part is unchanged)
-            r_px = self.cie_to_pixel(r_x, r_y)
-            g_px = self.cie_to_pixel(g_x, g_y)
-            b_px = self.cie_to_pixel(b_x, b_y)
-
-            # Format as SVG string "x1,y1 x2,y2 x3,y3"
-            return f"{r_px[0]},{r_px[1]} {g_px[0]},{g_px[1]} {b_px[0]},{b_px[1]}"
+            # Format as SVG string "x1,y1 x2,y2 x3,y3"; %g drops trailing zeros of the rounded values
+            return "%g,%g %g,%g %g,%g" % (r_px[0], r_px[1], g_px[0], g_px[1], b_px[0], b_px[1])
 
         except (TypeError, ValueError, IndexError) as e:
             logger.error(f"Error converting triangle points: {e}")
@@ -1,21 +1,31 @@
 # helpers.py
 import json
+import os
+import stat
 import sys
 import yaml
 import zipfile
 from pathlib import Path
 import datetime
 from collections import defaultdict
+from functools import lru_cache
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, TemplateError, select_autoescape
 from loguru import logger
+from markupsafe import Markup
 
 import src.graphics_helper as gfx  # Import our new helper
+import src.parse as parse
 import src.report as r
 import src.calculate as calc
 
 HTML_TEMPLATE_NAME = "report_template.html"
 
+# Deflate level for archives and file types that are already compressed (stored as-is)
+ARCHIVE_COMPRESS_LEVEL = 1
+ARCHIVE_WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+ARCHIVE_STORED_SUFFIXES = {".pdf", ".png", ".jpg", ".jpeg", ".webp", ".zip", ".gz", ".mp4"}
+
 # User-Friendly Name mapping for keys in the JSON results
 UFN_MAPPING = {
     "Brightness": "Brightness (cd/m²)",
@@ -55,6 +65,9 @@ COORD_KEYS_INTERNAL = {
     "White_x", "White_y", "Center_x", "Center_y"
 }
 
+# Primaries plotted on the CIE diagram, in (Red, Green, Blue) x/y order
+PLOT_COORD_KEYS = ("Red_x", "Red_y", "Green_x", "Green_y", "Blue_x", "Blue_y")
+
 GAMUT_KEYS_XY = {
     "Cg_rgb_area", "Cg_ntsc_area", "Cg_dcip3_area",
     "Cg_rgb", "Cg_ntsc", "Cg_dcip3",
@@ -80,6 +93,13 @@ DYNAMIC_VISIBILITY_KEYS = {
 # Metrics where lower values are better (inverted logic)
 LOWER_IS_BETTER_KEYS = {"Delta_e"}
 
+# CIE plot points that depend only on constants, computed once for all reports
+_COORD_MAPPER = gfx.SvgCoordinator()
+_SRGB_POINTS = _COORD_MAPPER.get_triangle_pixel_points(calc.COLOR_STANDARDS.get(calc.ColorSpace.SRGB))
+_NTSC_POINTS = _COORD_MAPPER.get_triangle_pixel_points(calc.COLOR_STANDARDS.get(calc.ColorSpace.NTSC))
+_DCIP3_POINTS = _COORD_MAPPER.get_triangle_pixel_points(calc.COLOR_STANDARDS.get(calc.ColorSpace.DCI_P3))
+_DEBUG_POINTS = json.loads(_COORD_MAPPER.get_debug_grid_points())
+
 
 def _get_cell_status(key: str, value: float, expected_values: dict, is_coordinate: bool = False):
     """
@@ -97,25 +117,42 @@ def _get_cell_status(key: str, value: float, expected_values: dict, is_coordinat
     if value is None:
         return None
 
+    return _status_from_bounds(key, value, _expected_bounds(key, expected_values), is_coordinate)
+
+
+def _expected_bounds(key: str, expected_values: dict) -> tuple:
+    """
+    Returns the (min, max, typ) expected values for a key, with missing
+    values and the string 'None' normalised to None.
+    """
     # No mapping needed, keys are same as YAML keys
-    expected = expected_values.get(key, {})
+    expected = expected_values.get(key)
+    if not expected:
+        return None, None, None
 
+    # Parse string 'None' as None
     min_val = expected.get("min")
+    if min_val == 'None':
+        min_val = None
     max_val = expected.get("max")
+    if max_val == 'None':
+        max_val = None
     typ_val = expected.get("typ")
+    if typ_val == 'None':
+        typ_val = None
 
-    # Parse string 'None' as None
-    def parse_val(v):
-        return None if v == 'None' or v is None else v
+    return min_val, max_val, typ_val
 
-    min_val = parse_val(min_val)
-    max_val = parse_val(max_val)
-    typ_val = parse_val(typ_val)
 
-    # Inverted logic for metrics where lower is better (e.g., DeltaE)
-    is_inverted = key in LOWER_IS_BETTER_KEYS
+def _status_from_bounds(key: str, value: float, bounds: tuple, is_coordinate: bool):
+    """
+    Applies the cell status rules of _get_cell_status to precomputed
+    (min, max, typ) bounds from _expected_bounds.
+    """
+    min_val, max_val, typ_val = bounds
 
-    if is_inverted:
+    # Inverted logic for metrics where lower is better (e.g., DeltaE)
+    if key in LOWER_IS_BETTER_KEYS:
         # For DeltaE: higher value = worse, only check max and typ as upper bounds
         if max_val is not None and value > max_val:
             return "fail"
@@ -188,14 +225,57 @@ def collect_tolerance_legend(main_report_data: dict, ufn_mapping: dict) -> dict:
 
     for key, data in main_report_data.items():
         tolerance_info = data.get("tolerance_applied")
-        if tolerance_info and isinstance(tolerance_info, dict):
-            percent = tolerance_info.get("percent")
-            if percent is not None:
-                metric_name = ufn_mapping.get(key, key)
-                tolerance_groups[percent].append(metric_name)
+        # Most metrics have no tolerance applied
+        if not tolerance_info or not isinstance(tolerance_info, dict):
+            continue
+        percent = tolerance_info.get("percent")
+        if percent is not None:
+            tolerance_groups[percent].append(ufn_mapping.get(key, key))
+
+    # Sort by percent descending for consistent display (percents are unique dict keys)
+    return dict(sorted(tolerance_groups.items(), reverse=True))
+
+
+@lru_cache(maxsize=4)
+def _get_template(template_dir: Path, template_name: str):
+    """
+    Builds the Jinja2 environment and compiles the template once per
+    template directory. Templates are not reloaded from disk afterwards.
+
+    Compiled bytecode is also kept in Jinja2's per-user cache folder in the
+    temp directory, so later runs skip compilation. Jinja2 checks the template
+    source checksum, so a changed template is recompiled automatically.
+    """
+    env = Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=select_autoescape(['html', 'xml']),
+        auto_reload=False,
+        bytecode_cache=_get_bytecode_cache()
+    )
+    return env.get_template(template_name)
+
+
+def _get_bytecode_cache():
+    """
+    Returns a bytecode cache in Jinja2's per-user temp folder, or None if that
+    folder can't be created or is not safe to use. The install folder is never
+    written to, as it may be read-only for installed builds.
+    """
+    try:
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError) as e:
+        logger.warning(f"Template bytecode cache disabled: {e}")
+        return None
 
-    # Sort by percent descending for consistent display
-    return dict(sorted(tolerance_groups.items(), key=lambda x: x[0], reverse=True))
+
+@parse.cached_by_stat(maxsize=4)
+def _load_svg_background(svg_path) -> Markup:
+    """
+    Reads the CIE diagram SVG background. The same background is used for
+    every report, so it is read from disk only once while the file is unchanged.
+    Returned as Markup: it is trusted markup that is inlined into the page unescaped.
+    """
+    return Markup(Path(svg_path).read_text(encoding="utf-8"))
 
 
 def create_html_report(
@@ -226,19 +306,25 @@ def create_html_report(
     logger.debug(f"Generating HTML report for {input_file.name}")
 
     # --- 1. Load Data ---
+    # Both inputs are required, check them before any parsing
+    if not input_file.is_file():
+        logger.error(f"Main report file not found at {input_file}")
+        return False
+    if not expected_yaml.is_file():
+        logger.error(f"Expected result file not found at {expected_yaml}")
+        return False
+
     try:
-        with open(input_file, "r") as f:
-            main_report_data = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+        main_report_data = json.loads(input_file.read_bytes())
+    except (OSError, json.JSONDecodeError) as e:
         logger.error(f"Error reading/parsing main report file {input_file}: {e}")
         return False
 
     try:
-        with open(expected_yaml, "r") as yaml_file:
-            expected_data = yaml.safe_load(yaml_file)
-            expected_values = r.expand_coordinates_tolerance(expected_data or {})
-    except FileNotFoundError:
-        logger.error(f"Expected result file not found at {expected_yaml}")
+        expected_data = parse.read_yaml_file(expected_yaml)
+        expected_values = r.expand_coordinates_tolerance(expected_data or {})
+    except OSError as e:
+        logger.error(f"Error reading expected result file {expected_yaml}: {e}")
         return False
     except yaml.YAMLError as e:
         logger.error(f"Could not parse YAML file: {e}")
@@ -257,16 +343,18 @@ def create_html_report(
     }
 
     # --- 1.5. SVG LOAD ---
+    # Optional: without it the report is still generated, just with an empty plot background
     raw_svg_background = ""
-    try:
-        with open(cie_background_svg, "r", encoding="utf-8") as f:
-            raw_svg_background = f.read()
-        logger.debug(f"Successfully read SVG background: {cie_background_svg}")
-    except Exception as e:
-        logger.error(f"Error reading SVG background file {cie_background_svg}: {e}")
+    if not cie_background_svg.is_file():
+        logger.error(f"SVG background file not found at {cie_background_svg}")
+    else:
+        try:
+            raw_svg_background = _load_svg_background(cie_background_svg)
+            logger.debug(f"Successfully read SVG background: {cie_background_svg}")
+        except (OSError, UnicodeDecodeError) as e:
+            logger.error(f"Error reading SVG background file {cie_background_svg}: {e}")
 
     # --- 2. Prepare Plot Coordinates ---
-    coord_mapper = gfx.SvgCoordinator()
     device_points = ""
     specification_points = ""
 
@@ -275,23 +363,17 @@ def create_html_report(
 
     # If coordinates exists build plot points for them
     if device_coordinates is not None:
-        device_points = coord_mapper.get_triangle_pixel_points(device_coordinates)
+        device_points = _COORD_MAPPER.get_triangle_pixel_points(device_coordinates)
     if specification_coordinates is not None:
-        specification_points = coord_mapper.get_triangle_pixel_points(specification_coordinates)
-
-    # Calculate points for standard triangles
-    srgb_points = coord_mapper.get_triangle_pixel_points(calc.COLOR_STANDARDS.get(calc.ColorSpace.SRGB))
-    ntsc_points = coord_mapper.get_triangle_pixel_points(calc.COLOR_STANDARDS.get(calc.ColorSpace.NTSC))
-    dcip3_points = coord_mapper.get_triangle_pixel_points(calc.COLOR_STANDARDS.get(calc.ColorSpace.DCI_P3))
-    debug_points = json.loads(coord_mapper.get_debug_grid_points())
+        specification_points = _COORD_MAPPER.get_triangle_pixel_points(specification_coordinates)
 
     summary_plot_points = {
         "device": device_points,
-        "srgb": srgb_points,
-        "ntsc": ntsc_points,
-        "dcip3": dcip3_points,
+        "srgb": _SRGB_POINTS,
+        "ntsc": _NTSC_POINTS,
+        "dcip3": _DCIP3_POINTS,
         "specification": specification_points,
-        "debug": debug_points,
+        "debug": _DEBUG_POINTS,
     }
 
     plot_triangles_checked = {
@@ -312,21 +394,16 @@ def create_html_report(
 
     template_dir = base_dir / "config"
 
-    env = Environment(
-        loader=FileSystemLoader(template_dir),
-        autoescape=select_autoescape(['html', 'xml'])
-    )
-
     try:
-        template = env.get_template(HTML_TEMPLATE_NAME)
-    except Exception as e:
+        template = _get_template(template_dir, HTML_TEMPLATE_NAME)
+    except (TemplateError, OSError) as e:
         logger.error(f"Error loading template '{HTML_TEMPLATE_NAME}' from '{template_dir}': {e}")
         return False
 
     # --- 4. Define Template Context ---
 
     # 1. Collect and process device reports for the new table
-    device_reports_data_filtered, device_reports_gamut_xy_filtered, device_reports_gamut_uv_filtered, device_reports_coordinates_filtered = process_device_reports(
+    device_reports_data_filtered, device_reports_gamut_xy_filtered, device_reports_gamut_uv_filtered, device_reports_coordinates_filtered, (first_date, last_date) = process_device_reports(
         device_reports, UFN_MAPPING, expected_values
     )
 
@@ -338,7 +415,7 @@ def create_html_report(
     }
 
     # 2. Calculate inspection date
-    inspection_date = get_inspection_date_range(device_reports_data_filtered)
+    inspection_date = format_inspection_date_range(first_date, last_date)
 
     context = {
         "main_report": main_report_filtered,
@@ -353,32 +430,35 @@ def create_html_report(
     }
 
     # --- 5. Render and Save HTML ---
+    # Render into a temporary file next to the report, so a failed render never
+    # leaves a truncated report or overwrites the previous good one
+    output_file = Path(output_file)
+    partial_file = output_file.with_name(output_file.name + ".tmp")
     try:
-        html_content = template.render(context)
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        # Stream rendered chunks straight to disk instead of building the whole page in memory,
+        # buffering 64 template events per write
+        stream = template.stream(context)
+        stream.enable_buffering(64)
+        with open(partial_file, "wb") as f:
+            stream.dump(f, encoding="utf-8")
+        os.replace(partial_file, output_file)
         logger.debug(f"Successfully created HTML report: {output_file}")
         return True
     except Exception as e:
         logger.error(f"Error rendering or saving HTML report: {e}")
+        try:
+            partial_file.unlink(missing_ok=True)
+        except OSError as unlink_error:
+            logger.warning(f"Could not remove partial report {partial_file}: {unlink_error}")
         return False
 
 
 def prepare_device_plot_coordinates(main_report_data):
     try:
-        # Helper function to get avg value
-        def get_avg_coord(name):
-            return main_report_data.get(name, {}).get("actual_values", {}).get("avg")
-
-        # Get individual coordinates
-        r_x = get_avg_coord("Red_x")
-        r_y = get_avg_coord("Red_y")
-        g_x = get_avg_coord("Green_x")
-        g_y = get_avg_coord("Green_y")
-        b_x = get_avg_coord("Blue_x")
-        b_y = get_avg_coord("Blue_y")
-
-        all_coordinates = [r_x, r_y, g_x, g_y, b_x, b_y]
+        # Get individual coordinates (avg values) in PLOT_COORD_KEYS order
+        get = main_report_data.get
+        all_coordinates = [get(name, {}).get("actual_values", {}).get("avg") for name in PLOT_COORD_KEYS]
+        r_x, r_y, g_x, g_y, b_x, b_y = all_coordinates
 
         # Check if all 6 coordinates were successfully found
         if all(c is not None for c in all_coordinates):
@@ -397,19 +477,10 @@ def prepare_device_plot_coordinates(main_report_data):
 
 def prepare_specification_plot_coordinates(expected_values):
     try:
-        # Helper function to get avg value
-        def get_coord(name):
-            return expected_values.get(name, {}).get("typ", {})
-
-        # Get individual coordinates
-        r_x = get_coord("Red_x")
-        r_y = get_coord("Red_y")
-        g_x = get_coord("Green_x")
-        g_y = get_coord("Green_y")
-        b_x = get_coord("Blue_x")
-        b_y = get_coord("Blue_y")
-
-        all_coordinates = [r_x, r_y, g_x, g_y, b_x, b_y]
+        # Get individual coordinates (typ values) in PLOT_COORD_KEYS order
+        get = expected_values.get
+        all_coordinates = [get(name, {}).get("typ", {}) for name in PLOT_COORD_KEYS]
+        r_x, r_y, g_x, g_y, b_x, b_y = all_coordinates
 
         # Check if all 6 coordinates were successfully found
         if all(c is not None for c in all_coordinates):
@@ -476,12 +547,46 @@ def process_device_reports(device_reports: list, ufn_mapping: dict, expected_val
         expected_values: Expected values from device configuration YAML
 
     Returns:
-        tuple: (main_reports, gamut_xy_reports, gamut_uv_reports, coord_reports) with cell status flags
+        tuple: (main_reports, gamut_xy_reports, gamut_uv_reports, coord_reports),
+            followed by the (earliest, latest) measurement dates, (None, None) if there are none.
+            Each report's "results" maps a UFN name to a (formatted value, cell status) pair.
     """
     main_reports = {}
     gamut_xy_reports = {}
     gamut_uv_reports = {}
     coord_reports = {}
+    # Earliest and latest valid measurement dates
+    first_date = last_date = None
+
+    # Format specs per metric, e.g. {"Brightness": ".0f"}
+    spec_get = {k: f".{p}f" for k, p in r.REPORT_PRECISION.items()}.get
+    # (UFN name, format spec) per key, filled on first use and shared by all devices
+    key_formats = {}
+
+    # Expected bounds are the same for every device, so read them once per key
+    bounds_by_key = {}
+
+    def cell_status(k, v, is_coordinate):
+        if v is None:
+            return None
+        bounds = bounds_by_key.get(k)
+        if bounds is None:
+            bounds = bounds_by_key[k] = _expected_bounds(k, expected_values)
+        return _status_from_bounds(k, v, bounds, is_coordinate)
+
+    # Helper logic for formatting
+    def format_val(k, v, default_spec):
+        key_format = key_formats.get(k)
+        if key_format is None:
+            key_format = key_formats[k] = (ufn_mapping.get(k, k), spec_get(k, default_spec))
+        ufn_key, spec = key_format
+        # Strings and None can't take a float spec, skip the exception path for them
+        if v is None or isinstance(v, str):
+            return ufn_key, str(v)
+        try:
+            return ufn_key, format(v, spec)
+        except (TypeError, ValueError):
+            return ufn_key, str(v)
 
     for data in device_reports:
         # Basic validation
@@ -495,62 +600,51 @@ def process_device_reports(device_reports: list, ufn_mapping: dict, expected_val
             "is_tv": data.get("IsTV", False)
         }
 
+        # Track the inspection date range in the same pass
+        try:
+            measurement_date = _parse_measurement_date(meta["measurement_date"])
+        except ValueError:
+            # Warned here, per report: the parser's cache would only warn once per value
+            logger.warning(f"Invalid date format skipped: {meta['measurement_date']}")
+            measurement_date = None
+        if measurement_date is not None:
+            if first_date is None or measurement_date < first_date:
+                first_date = measurement_date
+            if last_date is None or measurement_date > last_date:
+                last_date = measurement_date
+
+        # Each cell is a (formatted value, status) pair
         processed_main = {}
         processed_gamut_xy = {}
         processed_gamut_uv = {}
         processed_coords = {}
-        cell_status_main = {}
-        cell_status_gamut_xy = {}
-        cell_status_gamut_uv = {}
-        cell_status_coords = {}
 
         # Process Results
         for key, value in data["Results"].items():
             if key == "Measurements":
                 continue
 
-            # Helper logic for formatting
-            def format_val(k, v, default_prec):
-                ufn_key = ufn_mapping.get(k, k)
-                prec = r.REPORT_PRECISION.get(k, default_prec)
-                try:
-                    return ufn_key, f"{v:.{prec}f}"
-                except (TypeError, ValueError):
-                    return ufn_key, str(v)
-
             if key == "Coordinates":
                 for c_key, c_val in value.items():
-                    name, val = format_val(c_key, c_val, 3)
-                    processed_coords[name] = val
-                    status = _get_cell_status(c_key, c_val, expected_values, is_coordinate=True)
-                    if status:
-                        cell_status_coords[name] = status
+                    name, val = format_val(c_key, c_val, ".3f")
+                    processed_coords[name] = (val, cell_status(c_key, c_val, True))
             elif key in GAMUT_KEYS_XY:
-                name, val = format_val(key, value, 0)
-                processed_gamut_xy[name] = val
-                status = _get_cell_status(key, value, expected_values, is_coordinate=False)
-                if status:
-                    cell_status_gamut_xy[name] = status
+                name, val = format_val(key, value, ".0f")
+                processed_gamut_xy[name] = (val, cell_status(key, value, False))
             elif key in GAMUT_KEYS_UV:
-                name, val = format_val(key, value, 0)
-                processed_gamut_uv[name] = val
-                status = _get_cell_status(key, value, expected_values, is_coordinate=False)
-                if status:
-                    cell_status_gamut_uv[name] = status
+                name, val = format_val(key, value, ".0f")
+                processed_gamut_uv[name] = (val, cell_status(key, value, False))
             else:
-                name, val = format_val(key, value, 0)
-                processed_main[name] = val
-                status = _get_cell_status(key, value, expected_values, is_coordinate=False)
-                if status:
-                    cell_status_main[name] = status
+                name, val = format_val(key, value, ".0f")
+                processed_main[name] = (val, cell_status(key, value, False))
 
         # Save results once per device
-        main_reports[sn] = {"results": processed_main, "cell_status": cell_status_main, **meta}
-        gamut_xy_reports[sn] = {"results": processed_gamut_xy, "cell_status": cell_status_gamut_xy, **meta}
-        gamut_uv_reports[sn] = {"results": processed_gamut_uv, "cell_status": cell_status_gamut_uv, **meta}
-        coord_reports[sn] = {"results": processed_coords, "cell_status": cell_status_coords, **meta}
+        main_reports[sn] = {"results": processed_main, **meta}
+        gamut_xy_reports[sn] = {"results": processed_gamut_xy, **meta}
+        gamut_uv_reports[sn] = {"results": processed_gamut_uv, **meta}
+        coord_reports[sn] = {"results": processed_coords, **meta}
 
-    return main_reports, gamut_xy_reports, gamut_uv_reports, coord_reports
+    return main_reports, gamut_xy_reports, gamut_uv_reports, coord_reports, (first_date, last_date)
 
 
 def archive_specific_files(zip_path, files_to_archive, base_folder):
@@ -562,27 +656,45 @@ def archive_specific_files(zip_path, files_to_archive, base_folder):
 
     try:
         files_added = 0
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        # Resolve the fixed paths once instead of on every file
+        zip_path_resolved = zip_path.resolve()
+        base_folder_resolved = base_folder.resolve()
+        # A large write buffer batches the many small header/data writes into fewer syscalls
+        with open(zip_path, "wb", buffering=ARCHIVE_WRITE_BUFFER_SIZE) as zip_file, \
+                zipfile.ZipFile(zip_file, 'w', zipfile.ZIP_DEFLATED, compresslevel=ARCHIVE_COMPRESS_LEVEL) as zipf:
             for file_path in files_to_archive:
-                if not file_path.exists() or not file_path.is_file():
+                # One stat call covers both the existence and the regular-file check
+                try:
+                    is_regular_file = stat.S_ISREG(os.stat(file_path).st_mode)
+                except OSError:
+                    is_regular_file = False
+                if not is_regular_file:
                     logger.warning(f"File {file_path} not found, skipping for archive.")
                     continue
 
+                file_path_resolved = file_path.resolve()
+
                 # Ensure we don't archive the archive itself
-                if file_path.resolve() == zip_path.resolve():
+                if file_path_resolved == zip_path_resolved:
                     continue
 
+                # Deflating already compressed media wastes CPU for no size gain
+                if file_path.suffix.lower() in ARCHIVE_STORED_SUFFIXES:
+                    compress_type = zipfile.ZIP_STORED
+                else:
+                    compress_type = zipfile.ZIP_DEFLATED
+
                 try:
                     # Calculate path inside the zip
                     # e.g., 'data/report.json' or 'results/device.html'
-                    name_in_archive = file_path.resolve().relative_to(base_folder.resolve())
+                    name_in_archive = file_path_resolved.relative_to(base_folder_resolved)
 
-                    zipf.write(file_path, name_in_archive)
+                    zipf.write(file_path, name_in_archive, compress_type=compress_type)
                     files_added += 1
                 except ValueError as e:
                     # Fallback if relative_to fails (e.g., different drives)
                     logger.error(f"Cannot calculate relative path for {file_path}: {e}. Using flat name.")
-                    zipf.write(file_path, file_path.name)
+                    zipf.write(file_path, file_path.name, compress_type=compress_type)
 
         if files_added == 0:
             logger.warning("No valid files were added to the archive.")
@@ -606,61 +718,55 @@ def clear_specific_files(files_to_delete):
     logger.debug(f"Cleaning up {len(files_to_delete)} specific files...")
 
     for file_path in files_to_delete:
-        if file_path.exists() and file_path.is_file():
-            try:
-                file_path.unlink()
-                removed_count += 1
-            except Exception as e:
-                logger.error(f"Error deleting file {file_path}: {e}")
-        else:
+        # Unlink directly instead of stat-ing first; a missing file is just skipped
+        try:
+            file_path.unlink()
+            removed_count += 1
+        except FileNotFoundError:
             logger.warning(f"File {file_path} not found, skipping cleanup.")
+        except Exception as e:
+            logger.error(f"Error deleting file {file_path}: {e}")
 
     logger.debug(f"Total files removed during cleanup: {removed_count}")
 
 
 # helpers.py
 
+# English ordinal suffixes indexed by day of month (index 0 is unused)
+_DAY_SUFFIX = ('th',) + ('st', 'nd', 'rd') + ('th',) * 17 + ('st', 'nd', 'rd') + ('th',) * 7 + ('st',)
+
+
 def get_day_suffix(day):
     """Returns the English ordinal suffix (st, nd, rd, th) for a day."""
-    if 11 <= day <= 13:
-        return 'th'
-    if day % 10 == 1:
-        return 'st'
-    if day % 10 == 2:
-        return 'nd'
-    if day % 10 == 3:
-        return 'rd'
-    return 'th'
-
-
-def get_inspection_date_range(all_device_reports_data: dict) -> str:
+    return _DAY_SUFFIX[day]
+
+
+@lru_cache(maxsize=4096)
+def _parse_measurement_date(date_str):
     """
-    Parses all 'measurement_date' fields and returns a formatted date string.
+    Returns the date part of a 'measurement_date' (YYYYMMDDHHMMSS, as built in
+    process_device_reports), or None if it's missing.
+    Results are cached per raw string.
+
+    Raises:
+        ValueError: If the date is malformed (not cached).
     """
-    if not all_device_reports_data:
-        return "N/A"
+    if not date_str or date_str == "N/A":
+        return None
+    # We only care about the date part, so slice it instead of a full strptime
+    if len(date_str) != 14 or not date_str.isdigit():
+        raise ValueError(date_str)
+    return datetime.date(int(date_str[0:4]), int(date_str[4:6]), int(date_str[6:8]))
 
-    dates = set()
-    # Format based on 'measurement_date' in process_device_reports
-    date_format = "%Y%m%d%H%M%S"
-
-    for report in all_device_reports_data.values():
-        date_str = report.get("measurement_date")
-        if date_str and date_str != "N/A":
-            try:
-                # We only care about the date part
-                dt = datetime.datetime.strptime(date_str, date_format).date()
-                dates.add(dt)
-            except ValueError:
-                logger.warning(f"Invalid date format skipped: {date_str}")
-                continue
 
-    if not dates:
+def format_inspection_date_range(min_date, max_date) -> str:
+    """
+    Formats the earliest and latest measurement dates as a single date or a
+    date range, e.g. "1st November 2025" or "1st - 3rd November 2025".
+    """
+    if min_date is None or max_date is None:
         return "N/A"
 
-    min_date = min(dates)
-    max_date = max(dates)
-
     # Helper for formatting: e.g., "1st November 2025"
     def format_date(dt):
         day = dt.day
@@ -1,12 +1,69 @@
 import json
-import math
+import os
+from functools import lru_cache, partial, wraps
+from pathlib import Path
+
 import yaml
 from loguru import logger
 
+# libyaml-backed safe loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Measurement location -> its (x, y) keys in the get_coordinates result
+_COORDINATE_KEYS_BY_LOCATION = {
+    "RedColor": ("Red_x", "Red_y"),
+    "GreenColor": ("Green_x", "Green_y"),
+    "BlueColor": ("Blue_x", "Blue_y"),
+    "Center": ("Center_x", "Center_y"),
+    "WhiteColor": ("White_x", "White_y"),
+}
+
+
+def cached_by_stat(loader=None, *, maxsize=32):
+    """
+    Caches loader(path) while the file's mtime and size are unchanged.
+
+    Usable as @cached_by_stat or @cached_by_stat(maxsize=N). The loader is
+    called with the path as a string; a modified file is loaded again. The
+    cached result is shared between callers and must not be mutated.
+    The wrapper raises OSError (e.g. FileNotFoundError) if the file cannot
+    be stat'ed.
+    """
+    if loader is None:
+        return partial(cached_by_stat, maxsize=maxsize)
+
+    @lru_cache(maxsize=maxsize)
+    def load_cached(path, mtime_ns, size):
+        # mtime/size only key the cache
+        return loader(path)
+
+    @wraps(loader)
+    def load(path):
+        stat = os.stat(path)
+        return load_cached(os.fspath(path), stat.st_mtime_ns, stat.st_size)
+
+    load.cache_clear = load_cached.cache_clear
+    return load
+
+
+@cached_by_stat(maxsize=32)
+def read_yaml_file(filepath):
+    """
+    Parses a YAML file with the C loader when available.
+
+    The parsed data is cached while the file is unchanged, so the same device
+    config read by the comparison and the HTML report is parsed once.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        yaml.YAMLError: If the file is not valid YAML.
+    """
+    return yaml.load(Path(filepath).read_bytes(), Loader=YAML_LOADER)
+
 
 def parse_yaml(yaml_file, key_name, k):
-    with open(yaml_file, "r") as file:
-        yaml_data = yaml.safe_load(file)
+    # Shares read_yaml_file's parse cache, so repeated lookups don't re-read the file
+    yaml_data = read_yaml_file(yaml_file)
     value = (yaml_data or {}).get(key_name, {}).get(k, None)
     return value
 
@@ -47,24 +104,17 @@ def get_coordinates(device_report):
     if not device_report:
         return {}
 
-    coordinates = {f"{color}_{axis}": None for color in ["Red", "Green", "Blue", "Center", "White"] for axis in ["x", "y"]}
-
-    location_map = {
-        "RedColor": "Red",
-        "GreenColor": "Green",
-        "BlueColor": "Blue",
-        "WhiteColor": "White",
-        "Center": "Center"
-    }
+    coordinates = dict.fromkeys(key for keys in _COORDINATE_KEYS_BY_LOCATION.values() for key in keys)
 
     for measurement in device_report["Measurements"]:
         location = measurement["Location"]
-        target_key = location_map.get(location)
+        target_keys = _COORDINATE_KEYS_BY_LOCATION.get(location)
 
-        if target_key:
+        if target_keys:
+            x_key, y_key = target_keys
             try:
-                coordinates[f"{target_key}_x"] = float(measurement["x"])
-                coordinates[f"{target_key}_y"] = float(measurement["y"])
+                coordinates[x_key] = float(measurement["x"])
+                coordinates[y_key] = float(measurement["y"])
             except ValueError:
                 # Handle cases where 'x' or 'y' are not valid floats
                 pass
@@ -73,30 +123,29 @@ def get_coordinates(device_report):
 
 
 def find_closest_to_target(device_report, target_x, target_y):
-    # Parse the JSON data if it's a string
-    # Extract measurements
-    measurements = device_report.get("Measurements", [])
-
     # Initialize variables to track the closest location
     closest_location = None
-    closest_distance = float("inf")
+    closest_squared_distance = float("inf")
     reference_x = None
     reference_y = None
     reference_lv = None
 
     # Iterate through the measurements to find the closest location
-    for measurement in measurements:
+    for measurement in device_report.get("Measurements", []):
         # Get x, y, and Lv values
         x = float(measurement["x"])
         y = float(measurement["y"])
         lv = float(measurement["Lv"])
 
-        # Calculate the Euclidean distance to the target (x, y)
-        distance = math.sqrt((x - target_x) ** 2 + (y - target_y) ** 2)
+        # Squared Euclidean distance to the target (x, y); sqrt is monotonic,
+        # so it picks the same closest point
+        dx = x - target_x
+        dy = y - target_y
+        squared_distance = dx * dx + dy * dy
 
-        # Update the closest location if this one is closer
-        if distance < closest_distance:
-            closest_distance = distance
+        # Update the closest location if this one is closer (the first one wins on ties)
+        if squared_distance < closest_squared_distance:
+            closest_squared_distance = squared_distance
             closest_location = measurement["Location"]
             reference_x = x
             reference_y = y
@@ -133,11 +182,21 @@ def get_device_info(file_path):
     return device_config, is_tv, serial_number
 
 def parse_one_file(file_path):
-    """Loads and returns data from a single JSON file."""
+    """
+    Loads and returns data from a single JSON file.
+
+    main.py reads every report twice (get_device_info to group the files, then
+    the calculations), so the parse is cached while the file is unchanged. The
+    result is shared between callers and must not be mutated.
+    """
     try:
-        with open(file_path, "r") as file:
-            data = json.load(file)
-        return data
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+        return _load_json(file_path)
+    except (OSError, json.JSONDecodeError) as e:
         logger.error(f"Error reading/parsing file {file_path}: {e}")
-        return None
\ No newline at end of file
+        return None
+
+
+@cached_by_stat(maxsize=256)
+def _load_json(file_path):
+    """Parses a JSON file; cached by cached_by_stat while it is unchanged."""
+    return json.loads(Path(file_path).read_bytes())
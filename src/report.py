@@ -1,11 +1,13 @@
 import json
 import math
-from collections import defaultdict
+from collections import defaultdict, deque
 from pathlib import Path
 
 import yaml
 from loguru import logger
 
+import src.parse as parse
+
 REPORT_PRECISION = {
     "Brightness": 0,
     "Contrast": 0,
@@ -197,25 +199,64 @@ def set_nested_value(d, path_str, value):
         current[last_part] = value
 
 
-def is_effectively_all_null_stat_package(pkg):
+def _new_stats_accumulator():
+    """Running count/sum/min/max for one flattened key of calculate_full_report."""
+    return {"count": 0, "sum": 0, "min": None, "max": None, "lists": None}
+
+
+def _accumulate_stats(acc, value):
     """
-    Checks if a stat_package (dict with avg, min, max) contains all None values,
-    considering that avg/min/max could be scalars or lists.
+    Folds one sanitized value into a stats accumulator.
+
+    Numbers update the scalar stats; lists update element-wise stats (None
+    elements are skipped). None and empty dicts only mark the key as present.
     """
-    if not isinstance(pkg, dict):
-        return False
-    for stat_key in ["avg", "min", "max"]:
-        val = pkg.get(stat_key)
-        if val is None:
-            continue
-        if isinstance(val, list):
-            if any(
-                    x is not None for x in val
-            ):  # If any element in the list is not None
-                return False
-        elif val is not None:  # Scalar value is not None
-            return False
-    return True
+    if isinstance(value, list):
+        lists = acc["lists"]
+        if lists is None:
+            lists = acc["lists"] = {"count": [], "sum": [], "min": [], "max": []}
+
+        grow = len(value) - len(lists["count"])
+        if grow > 0:
+            # A longer list appeared: add columns no file has contributed to yet
+            lists["count"].extend([0] * grow)
+            lists["sum"].extend([0] * grow)
+            lists["min"].extend([None] * grow)
+            lists["max"].extend([None] * grow)
+
+        counts, sums, mins, maxs = lists["count"], lists["sum"], lists["min"], lists["max"]
+        for i, item in enumerate(value):
+            if item is None:
+                continue
+            counts[i] += 1
+            sums[i] += item
+            if mins[i] is None or item < mins[i]:
+                mins[i] = item
+            if maxs[i] is None or item > maxs[i]:
+                maxs[i] = item
+    elif isinstance(value, (int, float)):
+        acc["count"] += 1
+        acc["sum"] += value
+        if acc["min"] is None or value < acc["min"]:
+            acc["min"] = value
+        if acc["max"] is None or value > acc["max"]:
+            acc["max"] = value
+
+
+def _accumulated_stats(acc):
+    """Builds the {avg, min, max} stat package from a stats accumulator."""
+    lists = acc["lists"]
+    if lists is not None:
+        # Element-wise stats; any list value takes precedence over scalars for this key
+        return {
+            "avg": [total / count if count else None for total, count in zip(lists["sum"], lists["count"])],
+            "min": lists["min"],
+            "max": lists["max"],
+        }
+
+    if acc["count"]:
+        return {"avg": acc["sum"] / acc["count"], "min": acc["min"], "max": acc["max"]}
+    return {"avg": None, "min": None, "max": None}
 
 
 def calculate_full_report(device_reports, output_file, device_name) -> bool:
@@ -224,6 +265,9 @@ def calculate_full_report(device_reports, output_file, device_name) -> bool:
     calculates element-wise statistics (min, avg, max) for all numeric and list values,
     and saves the aggregated results to a new JSON file.
 
+    Statistics are accumulated in a single pass over the reports, so memory use
+    depends on the number of keys rather than the number of reports.
+
     Args:
         device_reports (list): A list of dictionaries, each representing a JSON report.
         output_file (str/Path): The path to save the final aggregated JSON report.
@@ -233,8 +277,8 @@ def calculate_full_report(device_reports, output_file, device_name) -> bool:
         bool: True if report was successfully calculated and saved, False otherwise.
     """
     try:
-        aggregated_data = defaultdict(list)  # Stores lists of values for each key path
-        all_keys_paths = set()  # Stores all unique flattened key paths encountered
+        # Running stats for each flattened key path that had a value in any report
+        stats_by_key = defaultdict(_new_stats_accumulator)
         serial_numbers = []
 
         for data in device_reports:
@@ -249,25 +293,26 @@ def calculate_full_report(device_reports, output_file, device_name) -> bool:
                 )
                 continue
 
-            def process_items(current_dict, current_path_parts):
+            # Walk the nested Results with an explicit stack of (dict, key path) pairs
+            pending = deque([(data["Results"], ())])
+            while pending:
+                current_dict, current_path_parts = pending.pop()
                 for key, value in current_dict.items():
-                    new_path_parts = current_path_parts + [key]
+                    new_path_parts = current_path_parts + (key,)
                     flat_key = ".".join(new_path_parts)
-                    all_keys_paths.add(flat_key)
 
                     if isinstance(value, dict):
                         if not value:  # Empty dictionary
-                            aggregated_data[flat_key].append(
-                                {}
-                            )  # Mark the presence of this key with an empty dict
-                        process_items(value, new_path_parts)  # Recurse
+                            # Mark the presence of this key without contributing a value
+                            _accumulate_stats(stats_by_key[flat_key], None)
+                        pending.append((value, new_path_parts))  # Visit nested keys later
                     elif value is None:
-                        aggregated_data[flat_key].append(None)
+                        _accumulate_stats(stats_by_key[flat_key], None)
                     elif isinstance(value, (int, float)):
                         if math.isnan(value) or math.isinf(value):
-                            aggregated_data[flat_key].append(None)
+                            _accumulate_stats(stats_by_key[flat_key], None)
                         else:
-                            aggregated_data[flat_key].append(value)
+                            _accumulate_stats(stats_by_key[flat_key], value)
                     elif isinstance(value, list):
                         sanitized_list = []
                         for item_in_list in value:
@@ -280,80 +325,13 @@ def calculate_full_report(device_reports, output_file, device_name) -> bool:
                             ):  # Allow numbers and None
                                 sanitized_list.append(item_in_list)
                             # Else: non-numeric/non-None items in a list are skipped for this element's stats
-                        aggregated_data[flat_key].append(sanitized_list)
-                    # Other data types (e.g., strings) are noted by all_keys_paths but not aggregated for stats
-
-            process_items(data["Results"], [])
+                        _accumulate_stats(stats_by_key[flat_key], sanitized_list)
+                    # Other data types (e.g., strings) are not aggregated for stats
 
         final_results_data = {}
-        sorted_key_paths = sorted(list(all_keys_paths))
-
-        for flat_key in sorted_key_paths:
-            values_list_for_key = aggregated_data.get(flat_key, [])
-
-            stat_package = {"avg": None, "min": None, "max": None}  # Default
-
-            if not values_list_for_key:
-                pass
-            elif all(
-                    v is None or (isinstance(v, dict) and not v) for v in values_list_for_key
-            ):
-                pass
-            elif any(isinstance(v, list) for v in values_list_for_key):
-                # Handles list-based statistics (element-wise)
-                valid_lists_data = []
-                max_len = 0
-                has_any_list = False
-                for item in values_list_for_key:
-                    if isinstance(item, list):  # Already sanitized during process_items
-                        valid_lists_data.append(item)
-                        max_len = max(max_len, len(item))
-                        has_any_list = True
-                    elif item is None:  # A file had 'null' for this list-type key
-                        valid_lists_data.append(None)
-
-                if not has_any_list:
-                    numeric_values = [
-                        v
-                        for v in values_list_for_key
-                        if isinstance(v, (int, float)) and v is not None
-                    ]
-                    if numeric_values:
-                        stat_package["avg"] = sum(numeric_values) / len(numeric_values)
-                        stat_package["min"] = min(numeric_values)
-                        stat_package["max"] = max(numeric_values)
-                elif max_len == 0:  # All lists were empty
-                    stat_package = {"avg": [], "min": [], "max": []}
-                else:
-                    avg_list, min_list, max_list = ([None] * max_len for _ in range(3))
-                    for i in range(max_len):
-                        column_elements = [
-                            lst[i]
-                            for lst in valid_lists_data
-                            if isinstance(lst, list)
-                               and i < len(lst)
-                               and isinstance(lst[i], (int, float))
-                        ]
-                        if column_elements:
-                            avg_list[i] = sum(column_elements) / len(column_elements)
-                            min_list[i] = min(column_elements)
-                            max_list[i] = max(column_elements)
-                    stat_package = {"avg": avg_list, "min": min_list, "max": max_list}
-            else:  # Scalar processing (list of numbers, possibly with Nones, empty dicts {})
-                numeric_values = [
-                    v
-                    for v in values_list_for_key
-                    if isinstance(v, (int, float)) and v is not None
-                ]
-                if numeric_values:
-                    stat_package["avg"] = sum(numeric_values) / len(numeric_values)
-                    stat_package["min"] = min(numeric_values)
-                    stat_package["max"] = max(numeric_values)
-
-            if not values_list_for_key and is_effectively_all_null_stat_package(
-                    stat_package
-            ):
-                continue
+
+        for flat_key in sorted(stats_by_key):
+            stat_package = _accumulated_stats(stats_by_key[flat_key])
 
             precision = REPORT_PRECISION.get(flat_key.split('.')[-1], 2)
 
@@ -405,9 +383,7 @@ def load_json_file(filepath):
 def load_yaml_file(filepath):
     """Loads data from a YAML file."""
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        return data
+        return parse.read_yaml_file(filepath)
     except FileNotFoundError:
         logger.error(f"YAML file not found at {filepath}")
         return None
@@ -56,6 +56,20 @@ def test_brightness_logic_display(mock_display_data):
     assert brightness_disp['max'] == pytest.approx(166.0, abs=0.1)
 
 
+def test_brightness_repeated_location_uses_last(mock_display_data):
+    """A repeated point counts once, with its last valid Lv, for min/max and typ."""
+    measurements = mock_display_data["Measurements"]
+    measurements.insert(0, {"Location": "Extra", "Lv": 50.0})
+    measurements.append({"Location": "Extra", "Lv": 150.0})
+    measurements.append({"Location": "Extra", "Lv": "invalid"})
+    measurements.append({"Location": "Center", "Lv": 170.0})
+
+    brightness_disp = calculate.brightness(mock_display_data, is_tv=False)
+    assert brightness_disp['min'] == pytest.approx(145.2, abs=0.1)
+    assert brightness_disp['typ'] == 170.0
+    assert brightness_disp['max'] == 170.0
+
+
 def test_brightness_empty_report():
     """Tests brightness function when passed None."""
     # REFACTORED: Pass None directly
@@ -104,6 +118,20 @@ def test_contrast_zero_lv(mock_display_data):
     assert contrast == 0.0
 
 
+def test_contrast_repeated_location_uses_last(mock_display_data):
+    """A repeated point uses its last measurement, like brightness typ."""
+    black_lv = 0.6183643  # From mock data
+    measurements = mock_display_data["Measurements"]
+    measurements.insert(0, {"Location": "Center", "Lv": "invalid"})
+    measurements.append({"Location": "Center", "Lv": 100.0})
+
+    assert calculate.contrast(mock_display_data, is_tv=False) == pytest.approx(round(100.0 / black_lv, 2))
+
+    # An invalid last measurement counts as 0 Lv, even after a valid one
+    measurements.append({"Location": "Center", "Lv": "invalid"})
+    assert calculate.contrast(mock_display_data, is_tv=False) == 0.0
+
+
 def test_temperature_extraction(mock_tv_data):
     """Checks color temperature (T) extraction from the center point."""
     # REFACTORED: Pass dict
@@ -0,0 +1,34 @@
+# tests/test_graphics_helper.py
+
+import json
+
+from src.graphics_helper import SvgCoordinator
+
+
+def test_cie_to_pixel_rounds_to_two_decimals():
+    """Tests conversion of a CIE point to rounded pixel coordinates."""
+    assert SvgCoordinator().cie_to_pixel(0.64, 0.33) == (373.4, 323.33)
+
+
+def test_get_triangle_pixel_points():
+    """Tests the SVG points string: two decimals at most, no trailing zeros."""
+    points = SvgCoordinator().get_triangle_pixel_points([[0.64, 0.33], [0.3, 0.6], [0.15, 0.06]])
+
+    assert points == "373.4,323.33 200,185.33 123.5,461.33"
+
+
+def test_get_triangle_pixel_points_invalid_input():
+    """Tests that malformed or non-numeric coordinates produce an empty string."""
+    coordinator = SvgCoordinator()
+
+    assert coordinator.get_triangle_pixel_points([]) == ""
+    assert coordinator.get_triangle_pixel_points([[0.64, 0.33], [0.3, 0.6]]) == ""
+    assert coordinator.get_triangle_pixel_points([[0.64, 0.33], [0.3, 0.6], ["bad", 0.06]]) == ""
+
+
+def test_get_debug_grid_points():
+    """Tests the axis corner points used for alignment debugging."""
+    corners = json.loads(SvgCoordinator().get_debug_grid_points())
+
+    assert corners["bottom_left"] == [47.0, 492.0]
+    assert corners["top_right"] == [455.0, 32.0]
@@ -1,17 +1,54 @@
 # tests/test_helpers.py
 
+import datetime
 import json
 import zipfile
 from pathlib import Path
 import yaml
 
 import pytest
-from jinja2 import Environment
+from jinja2 import Environment, FileSystemBytecodeCache, TemplateNotFound
 
 from src import helpers
 from src import report  # Import for precision constants
 
 
+def _stream_renders(mock_template, html):
+    """Makes a mocked template's stream().dump() write the given HTML to the open file."""
+    mock_template.stream.return_value.dump.side_effect = (
+        lambda fp, encoding="utf-8": fp.write(html.encode(encoding))
+    )
+
+
+_real_get_bytecode_cache = helpers._get_bytecode_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_template_cache(mocker, tmp_path):
+    """
+    Compiled templates are cached per process; tests mock Environment, so start clean.
+    Template bytecode goes to tmp_path instead of the user's temp folder.
+    """
+    bytecode_dir = tmp_path / "jinja_cache"
+    bytecode_dir.mkdir()
+    mocker.patch(
+        'src.helpers._get_bytecode_cache',
+        return_value=FileSystemBytecodeCache(directory=str(bytecode_dir)),
+    )
+    helpers._get_template.cache_clear()
+    yield
+    helpers._get_template.cache_clear()
+
+
+def test_get_bytecode_cache_disabled_when_folder_unusable(mocker):
+    """Tests that template bytecode caching is skipped if its folder can't be used."""
+    mocker.patch('src.helpers.FileSystemBytecodeCache', side_effect=RuntimeError("unsafe temp dir"))
+    assert _real_get_bytecode_cache() is None
+
+    mocker.patch('src.helpers.FileSystemBytecodeCache', side_effect=PermissionError("read-only"))
+    assert _real_get_bytecode_cache() is None
+
+
 # --------------------------------------------------------------------------------
 # NEW TESTS for HTML Reporting Logic
 # --------------------------------------------------------------------------------
@@ -19,7 +56,7 @@ from src import report  # Import for precision constants
 def test_process_device_reports(mocker):
     """
     Tests 'process_device_reports'.
-    Returns a tuple: (main_reports, gamut_xy_reports, gamut_uv_reports, coord_reports).
+    Returns a tuple: (main_reports, gamut_xy_reports, gamut_uv_reports, coord_reports, (first_date, last_date)).
     Checks flattening, formatting, UFN mapping, and separation into four groups.
     """
 
@@ -61,10 +98,11 @@ def test_process_device_reports(mocker):
     expected_values = {}
 
     # 3. Execute
-    main_data, gamut_xy_data, gamut_uv_data, coord_data = helpers.process_device_reports(device_reports_list, ufn_mapping, expected_values)
+    main_data, gamut_xy_data, gamut_uv_data, coord_data, date_range = helpers.process_device_reports(device_reports_list, ufn_mapping, expected_values)
 
     # 4. Verify Structure
     sn = "Device123"
+    assert date_range == (datetime.date(2025, 1, 1), datetime.date(2025, 1, 1))
     assert sn in main_data
     assert sn in gamut_xy_data
     assert sn in gamut_uv_data
@@ -72,21 +110,21 @@ def test_process_device_reports(mocker):
 
     # 5. Verify Main Data content
     assert "Peak Brightness" in main_data[sn]["results"]
-    assert main_data[sn]["results"]["Peak Brightness"] == "160"
+    assert main_data[sn]["results"]["Peak Brightness"] == ("160", None)
     assert "sRGB Area (%)" not in main_data[sn]["results"]
     assert "Red (x)" not in main_data[sn]["results"]
 
     # 6. Verify Gamut XY Data content (CIE 1931)
     assert "sRGB Area (%)" in gamut_xy_data[sn]["results"]
-    assert gamut_xy_data[sn]["results"]["sRGB Area (%)"] == "95.5"
+    assert gamut_xy_data[sn]["results"]["sRGB Area (%)"] == ("95.5", None)
     assert "sRGB Coverage (%)" in gamut_xy_data[sn]["results"]
-    assert gamut_xy_data[sn]["results"]["sRGB Coverage (%)"] == "88.2"
+    assert gamut_xy_data[sn]["results"]["sRGB Coverage (%)"] == ("88.2", None)
     assert "Peak Brightness" not in gamut_xy_data[sn]["results"]
     assert "Red (x)" not in gamut_xy_data[sn]["results"]
 
     # 7. Verify Coordinate Data content
     assert "Red (x)" in coord_data[sn]["results"]
-    assert coord_data[sn]["results"]["Red (x)"] == "0.648"
+    assert coord_data[sn]["results"]["Red (x)"] == ("0.648", None)
     assert "Peak Brightness" not in coord_data[sn]["results"]
     assert "sRGB Area (%)" not in coord_data[sn]["results"]
 
@@ -138,7 +176,7 @@ def test_create_html_report(mocker, tmp_path):
     """
     # 1. Mocks
     mock_template = mocker.MagicMock()
-    mock_template.render.return_value = "<html>Report</html>"
+    _stream_renders(mock_template, "<html>Report</html>")
     mock_env = mocker.MagicMock(spec=Environment)
     mock_env.get_template.return_value = mock_template
     mocker.patch('src.helpers.Environment', return_value=mock_env)
@@ -176,7 +214,8 @@ def test_create_html_report(mocker, tmp_path):
 
     # 4. Verify
     mock_env.get_template.assert_called_with(helpers.HTML_TEMPLATE_NAME)
-    mock_template.render.assert_called_once()
+    mock_template.stream.assert_called_once()
+    mock_template.stream.return_value.enable_buffering.assert_called_once_with(64)
     assert output_file.exists()
     assert output_file.read_text(encoding="utf-8") == "<html>Report</html>"
 
@@ -192,16 +231,34 @@ def test_archive_specific_files(mocker, tmp_path):
     base_folder = tmp_path
 
     file1 = tmp_path / "data" / "report1.json"
+    file2 = tmp_path / "data" / "plot.PNG"
+    file3 = tmp_path / "data" / "report1.pdf"
     (tmp_path / "data").mkdir()
     file1.touch()
+    file2.touch()
+    file3.touch()
 
-    files_to_archive = [file1]
+    files_to_archive = [file1, file2, file3]
     zip_path = tmp_path / "archive.zip"
 
     helpers.archive_specific_files(zip_path, files_to_archive, base_folder)
 
-    assert mock_zip_instance.write.call_count == 1
-    mock_zip_instance.write.assert_any_call(file1, Path("data") / "report1.json")
+    mock_zip_file.assert_called_once_with(
+        mocker.ANY, 'w', zipfile.ZIP_DEFLATED, compresslevel=helpers.ARCHIVE_COMPRESS_LEVEL
+    )
+    # The archive is written through a buffered file object opened on zip_path
+    assert Path(mock_zip_file.call_args[0][0].name) == zip_path
+    assert mock_zip_instance.write.call_count == 3
+    mock_zip_instance.write.assert_any_call(
+        file1, Path("data") / "report1.json", compress_type=zipfile.ZIP_DEFLATED
+    )
+    # Already compressed media is stored without deflating
+    mock_zip_instance.write.assert_any_call(
+        file2, Path("data") / "plot.PNG", compress_type=zipfile.ZIP_STORED
+    )
+    mock_zip_instance.write.assert_any_call(
+        file3, Path("data") / "report1.pdf", compress_type=zipfile.ZIP_STORED
+    )
 
 
 def test_clear_specific_files(tmp_path):
@@ -213,6 +270,12 @@ def test_clear_specific_files(tmp_path):
     helpers.clear_specific_files([file1])
     assert not file1.exists()
 
+    # Missing files and folders are skipped without raising
+    folder = tmp_path / "folder"
+    folder.mkdir()
+    helpers.clear_specific_files([file1, folder])
+    assert folder.exists()
+
 
 # --------------------------------------------------------------------------------
 # NEW TESTS for Return Values (bool validation)
@@ -222,7 +285,7 @@ def test_create_html_report_returns_true_on_success(mocker, tmp_path):
     """Tests that create_html_report returns True on successful execution."""
     # Setup mocks
     mock_template = mocker.MagicMock()
-    mock_template.render.return_value = "<html>Report</html>"
+    _stream_renders(mock_template, "<html>Report</html>")
     mock_env = mocker.MagicMock(spec=Environment)
     mock_env.get_template.return_value = mock_template
     mocker.patch('src.helpers.Environment', return_value=mock_env)
@@ -263,6 +326,71 @@ def test_create_html_report_returns_true_on_success(mocker, tmp_path):
     assert output_file.exists()
 
 
+def test_create_html_report_keeps_previous_report_on_render_error(mocker, tmp_path):
+    """A render that fails partway leaves the previous report untouched and no partial file."""
+    def fail_midway(fp, encoding="utf-8"):
+        fp.write(b"<html>Trunc")
+        raise RuntimeError("render failed")
+
+    mock_template = mocker.MagicMock()
+    mock_template.stream.return_value.dump.side_effect = fail_midway
+    mock_env = mocker.MagicMock(spec=Environment)
+    mock_env.get_template.return_value = mock_template
+    mocker.patch('src.helpers.Environment', return_value=mock_env)
+
+    input_file = tmp_path / "final_report.json"
+    input_file.write_text(json.dumps({"Results": {}}))
+    expected_file = tmp_path / "expected_report.yaml"
+    expected_file.write_text("Brightness:\n  min: 80\n  typ: 100\n  max: 120")
+    output_file = tmp_path / "output.html"
+    output_file.write_text("<html>Previous</html>")
+
+    result = helpers.create_html_report(
+        input_file=input_file,
+        output_file=output_file,
+        cie_background_svg=tmp_path / "missing.svg",
+        device_reports=[],
+        current_device_name="TestDevice",
+        app_version="1.0.0",
+        expected_yaml=expected_file,
+    )
+
+    assert result is False
+    assert output_file.read_text() == "<html>Previous</html>"
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_create_html_report_compiles_template_once(mocker, tmp_path):
+    """Tests that the Jinja2 template is built once and reused across reports."""
+    mock_template = mocker.MagicMock()
+    _stream_renders(mock_template, "<html>Report</html>")
+    mock_env = mocker.MagicMock(spec=Environment)
+    mock_env.get_template.return_value = mock_template
+    mock_env_cls = mocker.patch('src.helpers.Environment', return_value=mock_env)
+
+    input_file = tmp_path / "final_report.json"
+    input_file.write_text(json.dumps({"Results": {}}))
+    expected_file = tmp_path / "expected_report.yaml"
+    expected_file.write_text("Brightness:\n  min: 80\n  typ: 100\n  max: 120")
+    svg_file = tmp_path / "bg.svg"
+    svg_file.write_text("<svg></svg>")
+
+    for name in ("first.html", "second.html"):
+        assert helpers.create_html_report(
+            input_file=input_file,
+            output_file=tmp_path / name,
+            cie_background_svg=svg_file,
+            device_reports=[],
+            current_device_name="TestDevice",
+            app_version="1.0.0",
+            expected_yaml=expected_file,
+        ) is True
+
+    mock_env_cls.assert_called_once()
+    mock_env.get_template.assert_called_once_with(helpers.HTML_TEMPLATE_NAME)
+    assert mock_template.stream.call_count == 2
+
+
 def test_create_html_report_returns_false_on_missing_input_file(mocker, tmp_path):
     """Tests that create_html_report returns False when input file is missing."""
     input_file = tmp_path / "nonexistent.json"  # Does not exist
@@ -334,7 +462,7 @@ def test_create_html_report_returns_false_on_template_load_error(mocker, tmp_pat
 
     # Mock Environment to raise exception on get_template
     mock_env = mocker.MagicMock(spec=Environment)
-    mock_env.get_template.side_effect = Exception("Template not found")
+    mock_env.get_template.side_effect = TemplateNotFound(helpers.HTML_TEMPLATE_NAME)
     mocker.patch('src.helpers.Environment', return_value=mock_env)
 
     result = helpers.create_html_report(
@@ -518,22 +646,22 @@ def test_process_device_reports_with_cell_status(mocker):
         "Red_y": 3
     })
 
-    main_data, gamut_xy_data, gamut_uv_data, coord_data = helpers.process_device_reports([mock_report_data], ufn_mapping, expected_values)
+    main_data, gamut_xy_data, gamut_uv_data, coord_data, date_range = helpers.process_device_reports([mock_report_data], ufn_mapping, expected_values)
 
     sn = "Device456"
 
-    # Check cell status for main data
-    assert main_data[sn]["cell_status"]["Brightness (cd/m²)"] == "warning"
-    assert main_data[sn]["cell_status"]["Contrast Ratio"] == "fail"
-    assert "Color Temperature (K)" not in main_data[sn]["cell_status"]  # Normal, no status
+    # Check cell status for main data: each cell is a (value, status) pair
+    assert main_data[sn]["results"]["Brightness (cd/m²)"] == ("110", "warning")
+    assert main_data[sn]["results"]["Contrast Ratio"] == ("90", "fail")
+    assert main_data[sn]["results"]["Color Temperature (K)"] == ("9500", None)  # Normal, no status
 
     # Check cell status for gamut_xy data (CIE 1931)
-    assert gamut_xy_data[sn]["cell_status"]["sRGB Area (%)"] == "warning"
-    assert gamut_xy_data[sn]["cell_status"]["sRGB Coverage (%)"] == "fail"
+    assert gamut_xy_data[sn]["results"]["sRGB Area (%)"][1] == "warning"
+    assert gamut_xy_data[sn]["results"]["sRGB Coverage (%)"][1] == "fail"
 
     # Check cell status for coordinates
-    assert coord_data[sn]["cell_status"]["Red (x)"] == "fail"
-    assert "Red (y)" not in coord_data[sn]["cell_status"]  # Normal, no status
+    assert coord_data[sn]["results"]["Red (x)"] == ("0.590", "fail")
+    assert coord_data[sn]["results"]["Red (y)"][1] is None  # Normal, no status
 
 
 def test_should_display_metric_uv():
@@ -652,7 +780,7 @@ def test_create_html_report_plot_triangles_checked(mocker, tmp_path):
     and passed to the template context.
     """
     mock_template = mocker.MagicMock()
-    mock_template.render.return_value = "<html></html>"
+    _stream_renders(mock_template, "<html></html>")
     mock_env = mocker.MagicMock(spec=Environment)
     mock_env.get_template.return_value = mock_template
     mocker.patch('src.helpers.Environment', return_value=mock_env)
@@ -684,13 +812,13 @@ def test_create_html_report_plot_triangles_checked(mocker, tmp_path):
         app_version="1.0.0", expected_yaml=expected_file,
     )
 
-    context = mock_template.render.call_args[0][0]
+    context = mock_template.stream.call_args[0][0]
     assert context["plot_triangles_checked"]["srgb"] is True
     assert context["plot_triangles_checked"]["ntsc"] is False
     assert context["plot_triangles_checked"]["dcip3"] is True
 
     # Scenario 2: no CG keys in expected — все три False
-    mock_template.render.reset_mock()
+    mock_template.stream.reset_mock()
     expected_file.write_text(
         "Brightness:\n  min: 100\n  typ: 120\n  max: None\n"
     )
@@ -702,13 +830,13 @@ def test_create_html_report_plot_triangles_checked(mocker, tmp_path):
         app_version="1.0.0", expected_yaml=expected_file,
     )
 
-    context = mock_template.render.call_args[0][0]
+    context = mock_template.stream.call_args[0][0]
     assert context["plot_triangles_checked"]["srgb"] is False
     assert context["plot_triangles_checked"]["ntsc"] is False
     assert context["plot_triangles_checked"]["dcip3"] is False
 
     # Scenario 3: DCI-P3 only in UV variant — dcip3 must still be True
-    mock_template.render.reset_mock()
+    mock_template.stream.reset_mock()
     expected_file.write_text(
         "Cg_dcip3_area:\n  min: None\n  typ: None\n  max: None\n"
         "Cg_dcip3_uv_area:\n  min: 88\n  typ: 93\n  max: None\n"
@@ -721,7 +849,7 @@ def test_create_html_report_plot_triangles_checked(mocker, tmp_path):
         app_version="1.0.0", expected_yaml=expected_file,
     )
 
-    context = mock_template.render.call_args[0][0]
+    context = mock_template.stream.call_args[0][0]
     assert context["plot_triangles_checked"]["srgb"] is False
     assert context["plot_triangles_checked"]["ntsc"] is False
     assert context["plot_triangles_checked"]["dcip3"] is True
@@ -791,4 +919,61 @@ def test_collect_tolerance_legend_empty():
 
     legend = helpers.collect_tolerance_legend(main_report_data, ufn_mapping)
 
-    assert len(legend) == 0
\ No newline at end of file
+    assert len(legend) == 0
+
+
+def test_process_device_reports_date_range():
+    """
+    Tests the inspection date range tracked by process_device_reports,
+    skipping missing and invalid measurement dates.
+    """
+    def device(sn, measured=None):
+        data = {"SerialNumber": sn, "Results": {}}
+        if measured is not None:
+            data["MeasurementDateTime"] = measured
+        return data
+
+    device_reports = [
+        device("SN1", "20251103_120000"),
+        device("SN2", "20251101_120000"),
+        device("SN3"),
+        device("SN4", "2025110"),
+        device("SN5", "20251399_120000"),
+    ]
+    *_, date_range = helpers.process_device_reports(device_reports, {}, {})
+    assert date_range == (datetime.date(2025, 11, 1), datetime.date(2025, 11, 3))
+
+    *_, date_range = helpers.process_device_reports([device("SN1", "bad")], {}, {})
+    assert date_range == (None, None)
+
+
+def test_process_device_reports_warns_for_each_invalid_date(mocker):
+    """An invalid measurement date is reported for every report, not once per value."""
+    mock_logger = mocker.patch("src.helpers.logger")
+    device_reports = [{"SerialNumber": sn, "Results": {}, "MeasurementDateTime": "bad"} for sn in ("SN1", "SN2")]
+
+    helpers.process_device_reports(device_reports, {}, {})
+    helpers.process_device_reports(device_reports, {}, {})
+
+    warnings = [c for c in mock_logger.warning.call_args_list if "Invalid date format" in c.args[0]]
+    assert len(warnings) == 4
+
+
+def test_format_inspection_date_range():
+    """Tests formatting of single dates and date ranges."""
+    nov_1 = datetime.date(2025, 11, 1)
+    nov_3 = datetime.date(2025, 11, 3)
+    dec_2 = datetime.date(2025, 12, 2)
+
+    assert helpers.format_inspection_date_range(nov_1, nov_1) == "1st November 2025"
+    assert helpers.format_inspection_date_range(nov_1, nov_3) == "1st - 3rd November 2025"
+    assert helpers.format_inspection_date_range(nov_3, dec_2) == "3rd November 2025 - 2nd December 2025"
+    assert helpers.format_inspection_date_range(None, None) == "N/A"
+
+
+def test_get_day_suffix():
+    """Tests ordinal suffixes across the whole day-of-month range."""
+    expected = {1: "st", 2: "nd", 3: "rd", 4: "th", 11: "th", 12: "th", 13: "th",
+                21: "st", 22: "nd", 23: "rd", 24: "th", 30: "th", 31: "st"}
+    for day, suffix in expected.items():
+        assert helpers.get_day_suffix(day) == suffix
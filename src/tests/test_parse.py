@@ -36,6 +36,18 @@ def test_parse_one_file_failure(tmp_path):
     assert parse.parse_one_file(bad_file) is None
 
 
+def test_parse_one_file_reuses_parse_until_file_changes(tmp_path):
+    """get_device_info and the calculations share one parse of an unchanged report."""
+    test_file = tmp_path / "report.json"
+    test_file.write_text('{"SerialNumber": "SN1"}')
+
+    first = parse.parse_one_file(test_file)
+    assert parse.parse_one_file(str(test_file)) is first
+
+    test_file.write_text('{"SerialNumber": "SN22"}')
+    assert parse.parse_one_file(test_file) == {"SerialNumber": "SN22"}
+
+
 # --------------------------------------------------------------------------------
 # Unchanged YAML Tests
 # --------------------------------------------------------------------------------
@@ -50,6 +62,26 @@ def test_parse_yaml_success(tmp_path, mock_yaml_data):
     assert value == 80.0
 
 
+def test_cached_by_stat_reloads_changed_file(tmp_path, mocker):
+    """Unchanged files are loaded once; a modified file is loaded again."""
+    loader = mocker.Mock(side_effect=lambda path: {"text": open(path).read()})
+    load = parse.cached_by_stat(loader, maxsize=2)
+    test_file = tmp_path / "device.yaml"
+    test_file.write_text("a")
+
+    first = load(test_file)
+    assert first == {"text": "a"}
+    assert load(str(test_file)) is first
+    assert loader.call_count == 1
+
+    test_file.write_text("bb")
+    assert load(test_file) == {"text": "bb"}
+    assert loader.call_count == 2
+
+    with pytest.raises(FileNotFoundError):
+        load(tmp_path / "missing.yaml")
+
+
 # ... (other YAML tests like test_coordinate_srgb_ntsc are fine) ...
 
 # --------------------------------------------------------------------------------
@@ -85,6 +117,19 @@ def test_coordinates_of_triangle_missing_color(mock_display_data):
     assert coords == pytest.approx(expected)
 
 
+def test_coordinates_of_triangle_keeps_last_valid_point(mock_display_data):
+    """The last valid measurement per color is used, like contrast and brightness."""
+    measurements = mock_display_data["Measurements"]
+    measurements.append({"Location": "RedColor", "x": 0.7, "y": 0.3})
+    measurements.append({"Location": "RedColor", "x": "bad", "y": 0.1})
+
+    coords = parse.coordinates_of_triangle(mock_display_data)
+    assert coords[:2] == pytest.approx([0.7, 0.3])
+
+    measurements.append({"Location": "Center", "x": 0.1, "y": 0.1})
+    assert parse.get_coordinates(mock_display_data)["Center_x"] == 0.1
+
+
 def test_get_coordinates_logic(mock_display_data):
     """Tests get_coordinates for a non-TV device."""
     # REFACTORED: Pass dict
@@ -122,6 +167,11 @@ def test_find_closest_to_target(mock_display_data):
     assert closest["Location"] != "RedColor"
     assert "Center" in closest["Location"]
 
+    # No measurements: nothing to pick
+    assert parse.find_closest_to_target({}, target_x, target_y) == {
+        "Location": None, "x": None, "y": None, "Lv": None
+    }
+
 
 def test_get_device_info_success(mocker, mock_display_data, tmp_path):
     """Tests extracting device info. This function still reads files."""
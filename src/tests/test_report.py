@@ -28,18 +28,6 @@ def test_set_nested_value_merge_dict():
     assert d["Results"]["Brightness"] == {"min": 90.0, "avg": 100.0, "max": 110.0}
 
 
-def test_is_effectively_all_null_stat_package():
-    """Tests the check for an 'empty' statistics package."""
-    # All None (should be True)
-    assert report.is_effectively_all_null_stat_package({"avg": None, "min": None, "max": None}) is True
-    # List with None (should be True)
-    assert report.is_effectively_all_null_stat_package({"avg": [None, None], "min": None, "max": None}) is True
-    # Scalar (should be False)
-    assert report.is_effectively_all_null_stat_package({"avg": 100.0, "min": None, "max": None}) is False
-    # List with number (should be False)
-    assert report.is_effectively_all_null_stat_package({"avg": [None, 100.0], "min": None, "max": None}) is False
-
-
 def create_mock_device_report_dict(sn, value):
     """
     REFACTORED: Helper function to create a mock device report *dictionary*.
@@ -122,6 +110,61 @@ def test_calculate_full_report_aggregator_logic(tmp_path):
     assert array_stats["avg"] == pytest.approx([110.0, 115.0])
 
 
+def test_calculate_full_report_ragged_lists(tmp_path):
+    """List stats are element-wise over files that have a number at that index."""
+    reports_list = [
+        {"SerialNumber": "SN1", "Results": {"Zones": [1.0, None, 3.0]}},
+        {"SerialNumber": "SN2", "Results": {"Zones": [2.0]}},
+        {"SerialNumber": "SN3", "Results": {"Zones": None}},
+    ]
+    output_file = tmp_path / "full_report.json"
+
+    assert report.calculate_full_report(reports_list, str(output_file), "Monitor")
+
+    with open(output_file, "r") as f:
+        zones = json.load(f)["Results"]["Zones"]
+
+    assert zones["avg"] == [1.5, None, 3.0]
+    assert zones["min"] == [1.0, None, 3.0]
+    assert zones["max"] == [2.0, None, 3.0]
+
+
+def test_calculate_full_report_list_stats_keep_ints(tmp_path):
+    """Integer list data keeps int min/max, like scalar stats do."""
+    reports_list = [
+        {"SerialNumber": "SN1", "Results": {"Zones": [2, 5], "Count": 2}},
+        {"SerialNumber": "SN2", "Results": {"Zones": [3, 4], "Count": 3}},
+    ]
+    output_file = tmp_path / "full_report.json"
+
+    assert report.calculate_full_report(reports_list, str(output_file), "Monitor")
+
+    with open(output_file, "r") as f:
+        results = json.load(f)["Results"]
+
+    assert results["Zones"]["min"] == [2, 4]
+    assert all(type(v) is int for v in results["Zones"]["min"] + results["Zones"]["max"])
+    assert type(results["Count"]["min"]) is int
+
+
+def test_calculate_full_report_nested_results(tmp_path):
+    """Nested Results dicts are aggregated under their full key path."""
+    reports_list = [
+        {"SerialNumber": "SN1", "Results": {"Gamut": {"Srgb": {"Area": 90.0}, "Ntsc": 70.0}, "Name": "a"}},
+        {"SerialNumber": "SN2", "Results": {"Gamut": {"Srgb": {"Area": 100.0}, "Ntsc": {}}, "Name": "b"}},
+    ]
+    output_file = tmp_path / "full_report.json"
+
+    assert report.calculate_full_report(reports_list, str(output_file), "Monitor")
+
+    with open(output_file, "r") as f:
+        results = json.load(f)["Results"]
+
+    assert results["Gamut"]["Srgb"]["Area"] == {"avg": 95.0, "min": 90.0, "max": 100.0}
+    assert results["Gamut"]["Ntsc"] == {"avg": 70.0, "min": 70.0, "max": 70.0}
+    assert "Name" not in results
+
+
 def test_calculate_full_report_handles_bad_data(tmp_path):
     """
     REFACTORED: Tests calculate_full_report with problematic dictionaries in the list.